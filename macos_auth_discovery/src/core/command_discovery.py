@@ -4,239 +4,529 @@ Comprehensive macOS Authorization Discovery Engine
 Discovers authorization requirements across all major macOS system settings and security features
 """
 
+import ctypes
+import functools
+import grp
+import importlib
 import logging
 import subprocess
 import json
 import os
+import re
 import sqlite3
 import plistlib
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from .pane_discovery import SystemSettingsPaneDiscovery
 from .hardware_profile import HardwareProfileManager
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# IOKit's power source API has no pyobjc binding, so it is called through ctypes
+try:
+    _IOKIT = ctypes.CDLL("/System/Library/Frameworks/IOKit.framework/IOKit")
+    _IOKIT.IOPSCopyPowerSourcesInfo.restype = ctypes.c_void_p
+    _CORE_FOUNDATION = ctypes.CDLL("/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation")
+    _CORE_FOUNDATION.CFRelease.argtypes = [ctypes.c_void_p]
+    HAS_IOKIT = True
+except (OSError, AttributeError):
+    HAS_IOKIT = False
+
+# Biometric hardware named in `bioutil -rs` output, matched in a single pass
+_BIOMETRIC_PATTERN = re.compile("Touch ID|Face ID")
+
+
+# `tmutil status` prints a dictionary that always contains a Running key;
+# a backup is only in progress when its value is 1
+_TMUTIL_RUNNING_PATTERN = re.compile(r"\bRunning\s*=\s*1\s*;")
+
+
+# Most recently formatted timestamp, as (epoch second, ISO string). Replaced as
+# a whole so concurrent readers never see a second paired with another's string
+_LAST_TIMESTAMP = (0, "")
+_now = datetime.now
+
+
+def _current_timestamp() -> str:
+    """Get the current time as an ISO string, formatted at most once per second"""
+    global _LAST_TIMESTAMP
+    now = int(time.time())
+    last = _LAST_TIMESTAMP
+    if now != last[0]:
+        last = (now, _now().isoformat())
+        _LAST_TIMESTAMP = last
+    return last[1]
+
+
+# Per-tool command timeouts in seconds; anything not listed gets the default
+_DEFAULT_COMMAND_TIMEOUT = 5
+_COMMAND_TIMEOUTS = {
+    "system_profiler": 15,
+    "tmutil": 10,
+    "osascript": 10,
+}
+
+
+def _command_timeout(command: List[str]) -> int:
+    """Get the timeout for a command based on the tool it runs"""
+    return _COMMAND_TIMEOUTS.get(os.path.basename(command[0]), _DEFAULT_COMMAND_TIMEOUT)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_framework(name: str):
+    """Import an optional pyobjc framework module on first use, or None if unavailable
+    
+    pyobjc framework imports (Quartz in particular) are slow, so they are kept
+    out of module import and loaded only by the checks that use them.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# Result rows always carry a "type" key (enforced by _add_results)
+_get_type = itemgetter("type")
+
+
+# Comprehensive authorization mapping by System Settings location.
+# Built once at import; treat as read-only.
+_AUTHORIZATION_MAP = {
+    "Wi-Fi": [
+        {"element": "Network Configuration", "auth_type": "admin", "description": "Modify Wi-Fi network settings"},
+        {"element": "Advanced Settings", "auth_type": "admin", "description": "Configure Wi-Fi advanced options"},
+        {"element": "View Saved Passwords", "auth_type": "keychain", "description": "View stored Wi-Fi passwords"}
+    ],
+    "Bluetooth": [
+        {"element": "Device Pairing", "auth_type": "user_consent", "description": "Pair new Bluetooth devices"},
+        {"element": "Advanced Settings", "auth_type": "admin", "description": "Configure Bluetooth advanced options"}
+    ],
+    "Network": [
+        {"element": "Network Locations", "auth_type": "admin", "description": "Create/modify network locations"},
+        {"element": "DNS Settings", "auth_type": "admin", "description": "Modify DNS configuration"},
+        {"element": "Proxies", "auth_type": "admin", "description": "Configure proxy settings"},
+        {"element": "VPN Configuration", "auth_type": "admin", "description": "Add/modify VPN connections"}
+    ],
+    "Privacy & Security": [
+        {"element": "Location Services", "auth_type": "admin", "description": "Enable/disable location services"},
+        {"element": "Contacts", "auth_type": "admin", "description": "Manage app access to contacts"},
+        {"element": "Calendars", "auth_type": "admin", "description": "Manage app access to calendars"},
+        {"element": "Reminders", "auth_type": "admin", "description": "Manage app access to reminders"},
+        {"element": "Photos", "auth_type": "admin", "description": "Manage app access to photos"},
+        {"element": "Camera", "auth_type": "admin", "description": "Manage app access to camera"},
+        {"element": "Microphone", "auth_type": "admin", "description": "Manage app access to microphone"},
+        {"element": "Screen Recording", "auth_type": "admin", "description": "Manage screen recording permissions"},
+        {"element": "Files and Folders", "auth_type": "admin", "description": "Manage file system access"},
+        {"element": "Full Disk Access", "auth_type": "admin", "description": "Grant complete disk access"},
+        {"element": "Accessibility", "auth_type": "admin", "description": "Manage accessibility permissions"},
+        {"element": "Developer Tools", "auth_type": "admin", "description": "Allow debugging and development tools"},
+        {"element": "Input Monitoring", "auth_type": "admin", "description": "Monitor keyboard and mouse input"},
+        {"element": "FileVault", "auth_type": "admin", "description": "Enable/disable disk encryption"},
+        {"element": "Firewall", "auth_type": "admin", "description": "Configure application firewall"},
+        {"element": "Gatekeeper", "auth_type": "admin", "description": "Modify app security settings"},
+        {"element": "Security Extensions", "auth_type": "admin", "description": "Approve system extensions"}
+    ],
+    "Users & Groups": [
+        {"element": "Add User", "auth_type": "admin", "description": "Create new user accounts"},
+        {"element": "Delete User", "auth_type": "admin", "description": "Remove user accounts"},
+        {"element": "Change Password", "auth_type": "admin", "description": "Modify user passwords"},
+        {"element": "Admin Privileges", "auth_type": "admin", "description": "Grant/revoke admin rights"},
+        {"element": "Parental Controls", "auth_type": "admin", "description": "Configure user restrictions"},
+        {"element": "Login Options", "auth_type": "admin", "description": "Modify login settings"},
+        {"element": "Fast User Switching", "auth_type": "admin", "description": "Enable user switching"}
+    ],
+    "Sharing": [
+        {"element": "Screen Sharing", "auth_type": "admin", "description": "Enable remote screen access"},
+        {"element": "File Sharing", "auth_type": "admin", "description": "Share files over network"},
+        {"element": "Media Sharing", "auth_type": "admin", "description": "Share media libraries"},
+        {"element": "Printer Sharing", "auth_type": "admin", "description": "Share connected printers"},
+        {"element": "Remote Login", "auth_type": "admin", "description": "Enable SSH access"},
+        {"element": "Remote Management", "auth_type": "admin", "description": "Allow remote administration"},
+        {"element": "Remote Apple Events", "auth_type": "admin", "description": "Enable remote scripting"},
+        {"element": "Internet Sharing", "auth_type": "admin", "description": "Share internet connection"},
+        {"element": "Bluetooth Sharing", "auth_type": "admin", "description": "Share files via Bluetooth"},
+        {"element": "Content Caching", "auth_type": "admin", "description": "Cache content for network"}
+    ],
+    "Time Machine": [
+        {"element": "Enable Backups", "auth_type": "admin", "description": "Turn Time Machine on/off"},
+        {"element": "Select Backup Disk", "auth_type": "admin", "description": "Choose backup destination"},
+        {"element": "Backup Options", "auth_type": "admin", "description": "Configure backup settings"},
+        {"element": "Exclude Items", "auth_type": "admin", "description": "Exclude files from backup"}
+    ],
+    "Software Update": [
+        {"element": "Install Updates", "auth_type": "admin", "description": "Install system updates"},
+        {"element": "Automatic Updates", "auth_type": "admin", "description": "Configure auto-update settings"},
+        {"element": "Advanced Options", "auth_type": "admin", "description": "Beta and developer updates"}
+    ],
+    "General": [
+        {"element": "Startup Disk", "auth_type": "admin", "description": "Select boot disk"},
+        {"element": "Software Update", "auth_type": "admin", "description": "System update preferences"},
+        {"element": "Login Items", "auth_type": "user", "description": "Manage startup applications"},
+        {"element": "Language & Region", "auth_type": "admin", "description": "System language settings"}
+    ],
+    "Accessibility": [
+        {"element": "Display", "auth_type": "user", "description": "Visual accessibility options"},
+        {"element": "Zoom", "auth_type": "user", "description": "Screen magnification"},
+        {"element": "VoiceOver", "auth_type": "user", "description": "Screen reader settings"},
+        {"element": "Descriptions", "auth_type": "user", "description": "Audio descriptions"},
+        {"element": "Captions", "auth_type": "user", "description": "Subtitle preferences"},
+        {"element": "Motor", "auth_type": "user", "description": "Motor accessibility"},
+        {"element": "Switch Control", "auth_type": "admin", "description": "Switch-based navigation"},
+        {"element": "Voice Control", "auth_type": "admin", "description": "Voice navigation"},
+        {"element": "Keyboard", "auth_type": "user", "description": "Keyboard accessibility"},
+        {"element": "Pointer Control", "auth_type": "user", "description": "Mouse/trackpad accessibility"},
+        {"element": "Hearing", "auth_type": "user", "description": "Audio accessibility"},
+        {"element": "Audio", "auth_type": "user", "description": "Sound accessibility options"}
+    ],
+    "Energy Saver": [
+        {"element": "Sleep Settings", "auth_type": "admin", "description": "Configure sleep timers"},
+        {"element": "Power Adapter", "auth_type": "admin", "description": "Power adapter settings"},
+        {"element": "Battery", "auth_type": "admin", "description": "Battery optimization"},
+        {"element": "Schedule", "auth_type": "admin", "description": "Scheduled power events"}
+    ],
+    "Keyboard": [
+        {"element": "Modifier Keys", "auth_type": "user", "description": "Remap modifier keys"},
+        {"element": "Shortcuts", "auth_type": "user", "description": "Keyboard shortcuts"},
+        {"element": "Input Sources", "auth_type": "admin", "description": "Add/remove keyboards"},
+        {"element": "Dictation", "auth_type": "user", "description": "Voice dictation settings"}
+    ],
+    "Mouse": [
+        {"element": "Tracking Speed", "auth_type": "user", "description": "Mouse sensitivity"},
+        {"element": "Scrolling", "auth_type": "user", "description": "Scroll behavior"},
+        {"element": "Double-Click Speed", "auth_type": "user", "description": "Click timing"}
+    ],
+    "Trackpad": [
+        {"element": "Point & Click", "auth_type": "user", "description": "Trackpad clicking"},
+        {"element": "Scroll & Zoom", "auth_type": "user", "description": "Gesture settings"},
+        {"element": "More Gestures", "auth_type": "user", "description": "Advanced gestures"}
+    ],
+    "Printers & Scanners": [
+        {"element": "Add Printer", "auth_type": "admin", "description": "Install new printers"},
+        {"element": "Remove Printer", "auth_type": "admin", "description": "Remove printers"},
+        {"element": "Printer Options", "auth_type": "admin", "description": "Configure printer settings"}
+    ],
+    "Internet Accounts": [
+        {"element": "Add Account", "auth_type": "user", "description": "Add email/calendar accounts"},
+        {"element": "Account Settings", "auth_type": "user", "description": "Modify account settings"}
+    ],
+    "Passwords": [
+        {"element": "AutoFill Passwords", "auth_type": "keychain", "description": "Manage saved passwords"},
+        {"element": "Password Options", "auth_type": "admin", "description": "Password generation settings"}
+    ],
+    "Touch ID & Passcode": [
+        {"element": "Add Fingerprint", "auth_type": "admin", "description": "Enroll fingerprints"},
+        {"element": "Delete Fingerprint", "auth_type": "admin", "description": "Remove fingerprints"},
+        {"element": "Use Touch ID for", "auth_type": "admin", "description": "Touch ID permissions"}
+    ],
+    "Date & Time": [
+        {"element": "Set Date & Time", "auth_type": "admin", "description": "Modify system time"},
+        {"element": "Time Zone", "auth_type": "admin", "description": "Change time zone"},
+        {"element": "Network Time", "auth_type": "admin", "description": "Automatic time sync"}
+    ],
+    "Storage": [
+        {"element": "Optimize Storage", "auth_type": "user", "description": "Storage optimization"},
+        {"element": "Store in iCloud", "auth_type": "user", "description": "iCloud storage settings"}
+    ]
+}
+
+# Static System Settings pane list used when dynamic pane discovery fails
+_FALLBACK_SYSTEM_PANES = (
+    "Wi-Fi", "Bluetooth", "Network", "VPN", "Notifications", "Sound", "Focus", 
+    "Screen Time", "General", "Appearance", "Accessibility", "Control Center",
+    "Siri & Spotlight", "Privacy & Security", "Desktop & Dock", "Displays",
+    "Wallpaper", "Screen Saver", "Battery", "Energy Saver", "Keyboard", "Mouse",
+    "Trackpad", "Printers & Scanners", "Game Center", "Internet Accounts",
+    "Passwords", "Wallet & Apple Pay", "Users & Groups", "Touch ID & Passcode",
+    "Login Items", "Date & Time", "Sharing", "Time Machine", "Transfer or Reset",
+    "Software Update", "Storage"
+)
+
+# Privacy & Security app permission categories: the map's entries minus the
+# security features (FileVault, Firewall, ...) that are not permission lists
+_PRIVACY_PERMISSION_CATEGORIES = tuple(
+    entry["element"] for entry in _AUTHORIZATION_MAP["Privacy & Security"]
+    if entry["element"] not in ("FileVault", "Firewall", "Gatekeeper", "Security Extensions")
+)
+
+# Rows emitted by _generate_comprehensive_authorization_map, flattened once
+# from the map; callers get copies since results are annotated in place
+_AUTHORIZATION_MAP_ENTRIES = tuple(
+    {
+        "type": "system_settings",
+        "category": auth["element"],
+        "pane": pane_name,
+        "location": f"{pane_name} → {auth['element']}",
+        "status": "available",
+        "requires_auth": auth["auth_type"] != "none",
+        "auth_type": auth["auth_type"],
+        "description": auth["description"],
+        "source": "authorization_map"
+    }
+    for pane_name, authorizations in _AUTHORIZATION_MAP.items()
+    for auth in authorizations
+)
+
+
+def _auth_points_from_map(pane: str, entry_type: str, status: str, description: str,
+                          category: Optional[str] = None, elements=None) -> Tuple[Dict[str, Any], ...]:
+    """Build one auth point per authorization map entry of a pane
+    
+    description is a format string given the entry's element name; category
+    defaults to the element name; elements optionally restricts the entries.
+    """
+    return tuple(
+        {
+            "type": entry_type,
+            "category": category or entry["element"],
+            "location": f"{pane} → {entry['element']}",
+            "status": status,
+            "requires_auth": True,
+            "auth_type": entry["auth_type"],
+            "description": description.format(element=entry["element"])
+        }
+        for entry in _AUTHORIZATION_MAP.get(pane, [])
+        if elements is None or entry["element"] in elements
+    )
+
+
+# Rows emitted by the map-driven comprehensive checks, built once at import
+_PRIVACY_AUTH_POINTS = _auth_points_from_map(
+    "Privacy & Security", "privacy", "protected",
+    "Modifying {element} permissions requires admin authentication",
+    elements=_PRIVACY_PERMISSION_CATEGORIES
+)
+_USERS_GROUPS_AUTH_POINTS = _auth_points_from_map(
+    "Users & Groups", "accounts", "restricted",
+    "{element} requires administrator authentication",
+    category="User Management"
+)
+_SHARING_AUTH_POINTS = _auth_points_from_map(
+    "Sharing", "sharing", "configurable",
+    "Enabling {element} requires admin authentication",
+    category="Sharing Service"
+)
+
+# Accessibility panes reported by _check_accessibility_settings, and the
+# rows emitted for them, built once at import
+_ACCESSIBILITY_FEATURES = (
+    "Display", "Zoom", "VoiceOver", "Descriptions", "Captions",
+    "Motor", "Switch Control", "Voice Control", "Keyboard",
+    "Pointer Control", "Hearing", "Audio"
+)
+_ACCESSIBILITY_AUTH_POINTS = tuple(
+    {
+        "type": "accessibility",
+        "category": "Accessibility Feature",
+        "location": f"Accessibility → {feature}",
+        "status": "configurable",
+        "requires_auth": True,
+        "auth_type": "admin",
+        "description": f"Configuring {feature} accessibility settings may require authentication"
+    }
+    for feature in _ACCESSIBILITY_FEATURES
+)
+
+
 class CommandDiscoveryEngine:
-    """Discovers system authorization requirements using comprehensive system analysis"""
+    """Discovers system authorization requirements using comprehensive system analysis
+    
+    Status pollers that only need a result count should use get_results_total()
+    rather than get_results_summary() or get_results().
+    """
+    
+    # Fixed attribute layout: status getters are polled by the web dashboard
+    __slots__ = (
+        "logger", "discovery_results", "is_running", "no_sudo", "serial", "total_checks",
+        "current_check", "current_category", "start_time", "end_time", "completion_status",
+        "_od_node", "_category_counts", "_results_version", "_results_snapshot",
+        "_command_cache", "_command_cache_lock",
+        "_pane_discovery", "_system_panes", "_discovered_pane_info",
+        "_hardware_profile_manager", "authorization_map"
+    )
+    
+    # Discovery methods spend nearly all their time blocked in subprocesses
+    MAX_WORKERS = 8
+    # Maximum number of distinct command results memoized per discovery run
+    COMMAND_CACHE_SIZE = 128
     
-    def __init__(self, no_sudo=False):
+    def __init__(self, no_sudo=False, serial=False):
         self.logger = logging.getLogger(__name__)
         self.discovery_results = []
         self.is_running = False
-        self.progress = 0
         self.no_sudo = no_sudo
-        self.total_checks = 75  # Significantly increased for comprehensive coverage of all 36+ system areas
+        self.serial = serial  # Run discovery methods one at a time (useful for debugging)
+        self.total_checks = 0  # Set from the discovery method list below
         self.current_check = 0
         self.current_category = "Not started"  # Track current scanning category
         self.start_time = None  # Track when discovery starts
         self.end_time = None  # Track when discovery completes
         self.completion_status = "not_started"  # "not_started", "running", "completed", "stopped", "error"
+        self._od_node = None  # Local OpenDirectory node, opened on first use
+        self._category_counts = Counter()  # Result counts by type, maintained as results are added
+        self._results_version = 0  # Bumped after every change to discovery_results
+        self._results_snapshot = None  # (version, immutable copy of discovery_results) handed to readers
+        self._command_cache = OrderedDict()  # argv tuple -> (exit code, stdout, stderr), LRU ordered
+        self._command_cache_lock = threading.Lock()
         if no_sudo:
             self.logger.info("Running in no-sudo mode - some checks may be skipped")
         
-        # Initialize dynamic pane discovery
-        self.pane_discovery = SystemSettingsPaneDiscovery()
-        self._load_system_panes()
-        
-        # Initialize hardware profile manager
-        self.hardware_profile_manager = HardwareProfileManager()
-        
-        # Comprehensive authorization mapping by System Settings location
-        self.authorization_map = {
-            "Wi-Fi": [
-                {"element": "Network Configuration", "auth_type": "admin", "description": "Modify Wi-Fi network settings"},
-                {"element": "Advanced Settings", "auth_type": "admin", "description": "Configure Wi-Fi advanced options"},
-                {"element": "View Saved Passwords", "auth_type": "keychain", "description": "View stored Wi-Fi passwords"}
-            ],
-            "Bluetooth": [
-                {"element": "Device Pairing", "auth_type": "user_consent", "description": "Pair new Bluetooth devices"},
-                {"element": "Advanced Settings", "auth_type": "admin", "description": "Configure Bluetooth advanced options"}
-            ],
-            "Network": [
-                {"element": "Network Locations", "auth_type": "admin", "description": "Create/modify network locations"},
-                {"element": "DNS Settings", "auth_type": "admin", "description": "Modify DNS configuration"},
-                {"element": "Proxies", "auth_type": "admin", "description": "Configure proxy settings"},
-                {"element": "VPN Configuration", "auth_type": "admin", "description": "Add/modify VPN connections"}
-            ],
-            "Privacy & Security": [
-                {"element": "Location Services", "auth_type": "admin", "description": "Enable/disable location services"},
-                {"element": "Contacts", "auth_type": "admin", "description": "Manage app access to contacts"},
-                {"element": "Calendars", "auth_type": "admin", "description": "Manage app access to calendars"},
-                {"element": "Reminders", "auth_type": "admin", "description": "Manage app access to reminders"},
-                {"element": "Photos", "auth_type": "admin", "description": "Manage app access to photos"},
-                {"element": "Camera", "auth_type": "admin", "description": "Manage app access to camera"},
-                {"element": "Microphone", "auth_type": "admin", "description": "Manage app access to microphone"},
-                {"element": "Screen Recording", "auth_type": "admin", "description": "Manage screen recording permissions"},
-                {"element": "Files and Folders", "auth_type": "admin", "description": "Manage file system access"},
-                {"element": "Full Disk Access", "auth_type": "admin", "description": "Grant complete disk access"},
-                {"element": "Accessibility", "auth_type": "admin", "description": "Manage accessibility permissions"},
-                {"element": "Developer Tools", "auth_type": "admin", "description": "Allow debugging and development tools"},
-                {"element": "Input Monitoring", "auth_type": "admin", "description": "Monitor keyboard and mouse input"},
-                {"element": "FileVault", "auth_type": "admin", "description": "Enable/disable disk encryption"},
-                {"element": "Firewall", "auth_type": "admin", "description": "Configure application firewall"},
-                {"element": "Gatekeeper", "auth_type": "admin", "description": "Modify app security settings"},
-                {"element": "Security Extensions", "auth_type": "admin", "description": "Approve system extensions"}
-            ],
-            "Users & Groups": [
-                {"element": "Add User", "auth_type": "admin", "description": "Create new user accounts"},
-                {"element": "Delete User", "auth_type": "admin", "description": "Remove user accounts"},
-                {"element": "Change Password", "auth_type": "admin", "description": "Modify user passwords"},
-                {"element": "Admin Privileges", "auth_type": "admin", "description": "Grant/revoke admin rights"},
-                {"element": "Parental Controls", "auth_type": "admin", "description": "Configure user restrictions"},
-                {"element": "Login Options", "auth_type": "admin", "description": "Modify login settings"},
-                {"element": "Fast User Switching", "auth_type": "admin", "description": "Enable user switching"}
-            ],
-            "Sharing": [
-                {"element": "Screen Sharing", "auth_type": "admin", "description": "Enable remote screen access"},
-                {"element": "File Sharing", "auth_type": "admin", "description": "Share files over network"},
-                {"element": "Media Sharing", "auth_type": "admin", "description": "Share media libraries"},
-                {"element": "Printer Sharing", "auth_type": "admin", "description": "Share connected printers"},
-                {"element": "Remote Login", "auth_type": "admin", "description": "Enable SSH access"},
-                {"element": "Remote Management", "auth_type": "admin", "description": "Allow remote administration"},
-                {"element": "Remote Apple Events", "auth_type": "admin", "description": "Enable remote scripting"},
-                {"element": "Internet Sharing", "auth_type": "admin", "description": "Share internet connection"},
-                {"element": "Bluetooth Sharing", "auth_type": "admin", "description": "Share files via Bluetooth"},
-                {"element": "Content Caching", "auth_type": "admin", "description": "Cache content for network"}
-            ],
-            "Time Machine": [
-                {"element": "Enable Backups", "auth_type": "admin", "description": "Turn Time Machine on/off"},
-                {"element": "Select Backup Disk", "auth_type": "admin", "description": "Choose backup destination"},
-                {"element": "Backup Options", "auth_type": "admin", "description": "Configure backup settings"},
-                {"element": "Exclude Items", "auth_type": "admin", "description": "Exclude files from backup"}
-            ],
-            "Software Update": [
-                {"element": "Install Updates", "auth_type": "admin", "description": "Install system updates"},
-                {"element": "Automatic Updates", "auth_type": "admin", "description": "Configure auto-update settings"},
-                {"element": "Advanced Options", "auth_type": "admin", "description": "Beta and developer updates"}
-            ],
-            "General": [
-                {"element": "Startup Disk", "auth_type": "admin", "description": "Select boot disk"},
-                {"element": "Software Update", "auth_type": "admin", "description": "System update preferences"},
-                {"element": "Login Items", "auth_type": "user", "description": "Manage startup applications"},
-                {"element": "Language & Region", "auth_type": "admin", "description": "System language settings"}
-            ],
-            "Accessibility": [
-                {"element": "Display", "auth_type": "user", "description": "Visual accessibility options"},
-                {"element": "Zoom", "auth_type": "user", "description": "Screen magnification"},
-                {"element": "VoiceOver", "auth_type": "user", "description": "Screen reader settings"},
-                {"element": "Descriptions", "auth_type": "user", "description": "Audio descriptions"},
-                {"element": "Captions", "auth_type": "user", "description": "Subtitle preferences"},
-                {"element": "Motor", "auth_type": "user", "description": "Motor accessibility"},
-                {"element": "Switch Control", "auth_type": "admin", "description": "Switch-based navigation"},
-                {"element": "Voice Control", "auth_type": "admin", "description": "Voice navigation"},
-                {"element": "Keyboard", "auth_type": "user", "description": "Keyboard accessibility"},
-                {"element": "Pointer Control", "auth_type": "user", "description": "Mouse/trackpad accessibility"},
-                {"element": "Hearing", "auth_type": "user", "description": "Audio accessibility"},
-                {"element": "Audio", "auth_type": "user", "description": "Sound accessibility options"}
-            ],
-            "Energy Saver": [
-                {"element": "Sleep Settings", "auth_type": "admin", "description": "Configure sleep timers"},
-                {"element": "Power Adapter", "auth_type": "admin", "description": "Power adapter settings"},
-                {"element": "Battery", "auth_type": "admin", "description": "Battery optimization"},
-                {"element": "Schedule", "auth_type": "admin", "description": "Scheduled power events"}
-            ],
-            "Keyboard": [
-                {"element": "Modifier Keys", "auth_type": "user", "description": "Remap modifier keys"},
-                {"element": "Shortcuts", "auth_type": "user", "description": "Keyboard shortcuts"},
-                {"element": "Input Sources", "auth_type": "admin", "description": "Add/remove keyboards"},
-                {"element": "Dictation", "auth_type": "user", "description": "Voice dictation settings"}
-            ],
-            "Mouse": [
-                {"element": "Tracking Speed", "auth_type": "user", "description": "Mouse sensitivity"},
-                {"element": "Scrolling", "auth_type": "user", "description": "Scroll behavior"},
-                {"element": "Double-Click Speed", "auth_type": "user", "description": "Click timing"}
-            ],
-            "Trackpad": [
-                {"element": "Point & Click", "auth_type": "user", "description": "Trackpad clicking"},
-                {"element": "Scroll & Zoom", "auth_type": "user", "description": "Gesture settings"},
-                {"element": "More Gestures", "auth_type": "user", "description": "Advanced gestures"}
-            ],
-            "Printers & Scanners": [
-                {"element": "Add Printer", "auth_type": "admin", "description": "Install new printers"},
-                {"element": "Remove Printer", "auth_type": "admin", "description": "Remove printers"},
-                {"element": "Printer Options", "auth_type": "admin", "description": "Configure printer settings"}
-            ],
-            "Internet Accounts": [
-                {"element": "Add Account", "auth_type": "user", "description": "Add email/calendar accounts"},
-                {"element": "Account Settings", "auth_type": "user", "description": "Modify account settings"}
-            ],
-            "Passwords": [
-                {"element": "AutoFill Passwords", "auth_type": "keychain", "description": "Manage saved passwords"},
-                {"element": "Password Options", "auth_type": "admin", "description": "Password generation settings"}
-            ],
-            "Touch ID & Passcode": [
-                {"element": "Add Fingerprint", "auth_type": "admin", "description": "Enroll fingerprints"},
-                {"element": "Delete Fingerprint", "auth_type": "admin", "description": "Remove fingerprints"},
-                {"element": "Use Touch ID for", "auth_type": "admin", "description": "Touch ID permissions"}
-            ],
-            "Date & Time": [
-                {"element": "Set Date & Time", "auth_type": "admin", "description": "Modify system time"},
-                {"element": "Time Zone", "auth_type": "admin", "description": "Change time zone"},
-                {"element": "Network Time", "auth_type": "admin", "description": "Automatic time sync"}
-            ],
-            "Storage": [
-                {"element": "Optimize Storage", "auth_type": "user", "description": "Storage optimization"},
-                {"element": "Store in iCloud", "auth_type": "user", "description": "iCloud storage settings"}
-            ]
-        }
-        
-    def _run_command(self, command: str) -> tuple[int, str, str]:
-        """Run a shell command and return exit code, stdout, stderr"""
+        # Pane discovery and hardware profiling run subprocesses, so they are
+        # deferred until first accessed (see the properties below)
+        self._pane_discovery = None
+        self._system_panes = None
+        self._discovered_pane_info = None
+        self._hardware_profile_manager = None
+        
+        # One progress step per discovery method
+        self.total_checks = len(self._get_discovery_methods())
+        
+        # Static tables shared by all engine instances
+        self.authorization_map = _AUTHORIZATION_MAP
+        
+    def _run_command(self, command: List[str]) -> tuple[int, str, str]:
+        """Run a command (argv list, no shell) and return exit code, stdout, stderr
+        
+        Results are memoized per discovery run, so repeated probes of the same
+        command reuse the first result instead of spawning another process.
+        """
+        key = tuple(command)
+        with self._command_cache_lock:
+            if key in self._command_cache:
+                self._command_cache.move_to_end(key)
+                return self._command_cache[key]
+        
+        result = self._execute_command(command)
+        with self._command_cache_lock:
+            self._command_cache[key] = result
+            if len(self._command_cache) > self.COMMAND_CACHE_SIZE:
+                self._command_cache.popitem(last=False)
+        return result
+
+    def _execute_command(self, command: List[str]) -> tuple[int, str, str]:
+        """Execute a command without consulting the command cache"""
         try:
             process = subprocess.run(
                 command,
-                shell=True,
                 capture_output=True,
-                text=True,
-                timeout=30
+                timeout=_command_timeout(command)
+            )
+            # Decode explicitly so non-UTF-8 tool output cannot raise
+            return (
+                process.returncode,
+                process.stdout.decode("utf-8", "replace"),
+                process.stderr.decode("utf-8", "replace")
             )
-            return process.returncode, process.stdout, process.stderr
         except subprocess.TimeoutExpired:
-            self.logger.error(f"Command timeout: {command}")
+            self.logger.error(f"Command timeout: {' '.join(command)}")
             return 1, "", "Command timeout"
+        except FileNotFoundError as e:
+            # Same outcome a shell reports for a missing tool
+            self.logger.debug(f"Command not found: {command[0]}")
+            return 127, "", str(e)
         except Exception as e:
             self.logger.error(f"Command execution error: {e}")
             return 1, "", str(e)
 
+    def _run_command_rc(self, command: List[str]) -> int:
+        """Run a command (argv list, no shell) for its exit code only, discarding all output"""
+        try:
+            return subprocess.run(
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=_command_timeout(command)
+            ).returncode
+        except subprocess.TimeoutExpired:
+            self.logger.error(f"Command timeout: {' '.join(command)}")
+            return 1
+        except FileNotFoundError:
+            self.logger.debug(f"Command not found: {command[0]}")
+            return 127
+        except Exception as e:
+            self.logger.error(f"Command execution error: {e}")
+            return 1
+
+    def clear_cache(self):
+        """Drop memoized command results, forcing the next probes to run afresh"""
+        with self._command_cache_lock:
+            self._command_cache.clear()
+
     def _update_progress(self, category: str):
-        """Update discovery progress"""
-        self.current_check += 1
+        """Record the category a discovery method has started scanning"""
         self.current_category = category  # Track what we're currently scanning
-        self.progress = int((self.current_check / self.total_checks) * 100)
-        self.logger.info(f"Checking {category} ({self.current_check}/{self.total_checks})...")
+        self.logger.debug(f"Checking {category}...")
+
+    def _complete_check(self):
+        """Count one finished discovery method towards progress"""
+        # Only called from the dispatching thread, so a plain increment is safe
+        self.current_check += 1
+
+    @property
+    def progress(self) -> int:
+        """Discovery progress percentage, computed from completed checks on read"""
+        if self.completion_status == "completed":
+            return 100
+        if not self.total_checks:
+            return 0
+        return min(100, int(self.current_check * 100 / self.total_checks))
+
+    @property
+    def pane_discovery(self) -> SystemSettingsPaneDiscovery:
+        """Dynamic pane discovery, created on first use"""
+        if self._pane_discovery is None:
+            self._pane_discovery = SystemSettingsPaneDiscovery()
+        return self._pane_discovery
+
+    @property
+    def system_panes(self) -> List[str]:
+        """Names of the available System Settings panes, discovered on first use"""
+        if self._system_panes is None:
+            self._load_system_panes()
+        return self._system_panes
+
+    @property
+    def discovered_pane_info(self) -> Optional[List[Dict[str, Any]]]:
+        """Full pane info from dynamic discovery, or None if it failed"""
+        if self._system_panes is None:
+            self._load_system_panes()
+        return self._discovered_pane_info
+
+    @property
+    def hardware_profile_manager(self) -> HardwareProfileManager:
+        """Hardware profile manager, created (and hardware detected) on first use"""
+        if self._hardware_profile_manager is None:
+            self._hardware_profile_manager = HardwareProfileManager()
+        return self._hardware_profile_manager
 
     def _load_system_panes(self):
         """Load system settings panes dynamically based on current system"""
         try:
             self.logger.info("Discovering System Settings panes dynamically...")
             discovered_panes = self.pane_discovery.discover_all_panes()
-            self.system_panes = self.pane_discovery.get_pane_names()
+            system_panes = self.pane_discovery.get_pane_names()
             
-            self.logger.info(f"Discovered {len(self.system_panes)} available panes:")
-            for pane in self.system_panes:
+            self.logger.info(f"Discovered {len(system_panes)} available panes:")
+            for pane in system_panes:
                 self.logger.debug(f"  - {pane}")
-                
-            # Update total checks based on discovered panes
-            base_checks = 49  # Base number of security checks (added Authorization Database check)
-            pane_checks = len(self.system_panes) * 2  # Each pane gets 2 checks on average
-            self.total_checks = base_checks + pane_checks
             
             # Store full pane info for later use
-            self.discovered_pane_info = discovered_panes
+            self._discovered_pane_info = discovered_panes
+            self._system_panes = system_panes
             
         except Exception as e:
             self.logger.error(f"Failed to discover system panes dynamically: {e}")
             # Fallback to static list
-            self.system_panes = [
-                "Wi-Fi", "Bluetooth", "Network", "VPN", "Notifications", "Sound", "Focus", 
-                "Screen Time", "General", "Appearance", "Accessibility", "Control Center",
-                "Siri & Spotlight", "Privacy & Security", "Desktop & Dock", "Displays",
-                "Wallpaper", "Screen Saver", "Battery", "Energy Saver", "Keyboard", "Mouse",
-                "Trackpad", "Printers & Scanners", "Game Center", "Internet Accounts",
-                "Passwords", "Wallet & Apple Pay", "Users & Groups", "Touch ID & Passcode",
-                "Login Items", "Date & Time", "Sharing", "Time Machine", "Transfer or Reset",
-                "Software Update", "Storage"
-            ]
+            self._system_panes = list(_FALLBACK_SYSTEM_PANES)
 
     def _enhance_authorization_rights(self, auth_points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Enhance authorization points by attempting to find authorization rights for those that don't have them"""
@@ -340,12 +630,8 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check VPN configurations
-        vpn_configs = []
-        code, stdout, stderr = self._run_command("networksetup -listallnetworkservices")
-        if code == 0:
-            for line in stdout.splitlines():
-                if "VPN" in line:
-                    vpn_configs.append(line.strip())
+        code, stdout, stderr = self._run_command(["networksetup", "-listallnetworkservices"])
+        vpn_configs = [line.strip() for line in stdout.splitlines() if "VPN" in line] if code == 0 else []
         
         if vpn_configs:
             auth_points.append({
@@ -431,7 +717,7 @@ class CommandDiscoveryEngine:
             ]
             
             for right in priority_rights_to_check:
-                code, stdout, stderr = self._run_command(f"security authorizationdb read {right}")
+                code, stdout, stderr = self._run_command(["security", "authorizationdb", "read", right])
                 if code == 0:
                     try:
                         # Parse the plist output
@@ -496,9 +782,8 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check for admin users
-        code, stdout, stderr = self._run_command("dscl . -read /Groups/admin GroupMembership")
-        if code == 0:
-            admin_users = stdout.replace("GroupMembership:", "").strip().split()
+        admin_users = self._get_admin_group_members()
+        if admin_users is not None:
             auth_points.append({
                 "type": "accounts",
                 "category": "Administrator Accounts",
@@ -511,13 +796,41 @@ class CommandDiscoveryEngine:
 
         return auth_points
 
+    def _get_admin_group_members(self) -> Optional[List[str]]:
+        """Get admin group members via OpenDirectory or getgrnam, falling back to dscl"""
+        od = _load_framework("OpenDirectory")
+        if od is not None:
+            try:
+                if self._od_node is None:
+                    self._od_node, error = od.ODNode.nodeWithSession_type_error_(
+                        od.ODSession.defaultSession(), od.kODNodeTypeLocalNodes, None
+                    )
+                record, error = self._od_node.recordWithRecordType_name_attributes_error_(
+                    od.kODRecordTypeGroups, "admin", [od.kODAttributeTypeGroupMembership], None
+                )
+                if record is not None:
+                    members, error = record.valuesForAttribute_error_(od.kODAttributeTypeGroupMembership, None)
+                    return [str(member) for member in members or []]
+            except Exception as e:
+                self.logger.debug(f"OpenDirectory admin group lookup failed: {e}")
+        
+        try:
+            return list(grp.getgrnam("admin").gr_mem)
+        except KeyError:
+            pass
+        
+        code, stdout, stderr = self._run_command(["dscl", ".", "-read", "/Groups/admin", "GroupMembership"])
+        if code != 0:
+            return None
+        return stdout.partition("GroupMembership:")[2].split()
+
     def _check_keychain_access(self) -> List[Dict[str, Any]]:
         """Check Keychain access and authentication"""
         self._update_progress("Keychain Access")
         auth_points = []
         
         # Check for keychains
-        code, stdout, stderr = self._run_command("security list-keychains")
+        code, stdout, stderr = self._run_command(["security", "list-keychains"])
         if code == 0:
             keychains = [line.strip().strip('"') for line in stdout.splitlines() if line.strip()]
             for keychain in keychains:
@@ -540,16 +853,23 @@ class CommandDiscoveryEngine:
         
         # Check for preference panes that require authentication
         pref_panes = [
-            "/System/Library/PreferencePanes/Security.prefPane",
-            "/System/Library/PreferencePanes/Accounts.prefPane", 
-            "/System/Library/PreferencePanes/Network.prefPane",
-            "/System/Library/PreferencePanes/SharingPref.prefPane",
-            "/System/Library/PreferencePanes/TimeMachine.prefPane"
+            "Security.prefPane",
+            "Accounts.prefPane",
+            "Network.prefPane",
+            "SharingPref.prefPane",
+            "TimeMachine.prefPane"
         ]
         
+        # One directory listing instead of a stat() per pane
+        try:
+            with os.scandir("/System/Library/PreferencePanes") as entries:
+                installed_panes = {entry.name for entry in entries}
+        except OSError:
+            installed_panes = set()
+        
         for pane in pref_panes:
-            if os.path.exists(pane):
-                pane_name = os.path.basename(pane).replace(".prefPane", "")
+            if pane in installed_panes:
+                pane_name = pane.replace(".prefPane", "")
                 auth_points.append({
                     "type": "system_preferences",
                     "category": "Protected Preference Pane",
@@ -568,7 +888,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check for Xcode command line tools
-        code, stdout, stderr = self._run_command("xcode-select -p")
+        code, stdout, stderr = self._run_command(["xcode-select", "-p"])
         if code == 0:
             auth_points.append({
                 "type": "development",
@@ -588,8 +908,8 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check Wi-Fi network configurations
-        code, stdout, stderr = self._run_command("networksetup -listallhardwareports | grep Wi-Fi -A1")
-        if code == 0:
+        code, stdout, stderr = self._run_command(["networksetup", "-listallhardwareports"])
+        if code == 0 and "Wi-Fi" in stdout:
             auth_points.append({
                 "type": "network",
                 "category": "Wi-Fi",
@@ -601,8 +921,9 @@ class CommandDiscoveryEngine:
             })
         
         # Check for stored Wi-Fi passwords
-        code, stdout, stderr = self._run_command("security find-generic-password -D 'AirPort network password' 2>/dev/null | wc -l")
-        if code == 0 and stdout.strip() != "0":
+        # Exit status 44 means no matching keychain item
+        code, stdout, stderr = self._run_command(["security", "find-generic-password", "-D", "AirPort network password"])
+        if code == 0 and stdout.strip():
             auth_points.append({
                 "type": "network",
                 "category": "Wi-Fi",
@@ -621,8 +942,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check Bluetooth configuration
-        code, stdout, stderr = self._run_command("system_profiler SPBluetoothDataType")
-        if code == 0 and "Bluetooth" in stdout:
+        if self._has_bluetooth_controller():
             auth_points.append({
                 "type": "network",
                 "category": "Bluetooth",
@@ -635,77 +955,78 @@ class CommandDiscoveryEngine:
         
         return auth_points
 
+    def _has_bluetooth_controller(self) -> bool:
+        """Check for a Bluetooth controller without walking system_profiler"""
+        # The controller power state is only recorded when a controller exists
+        if "ControllerPowerState" in (self._load_plist("/Library/Preferences/com.apple.Bluetooth.plist") or {}):
+            return True
+        
+        code, stdout, stderr = self._run_command(["ioreg", "-r", "-c", "IOBluetoothHCIController", "-d", "1"])
+        return code == 0 and bool(stdout.strip())
+
+    def _load_plist(self, path: str) -> Optional[Dict[str, Any]]:
+        """Load a property list file in-process, or None if it is missing or unreadable"""
+        try:
+            with open(path, "rb") as f:
+                data = plistlib.load(f)
+        except Exception as e:
+            # Truncated XML plists raise ExpatError, binary ones InvalidFileException
+            self.logger.debug(f"Could not load plist {path}: {e}")
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _has_network_locations(self) -> bool:
+        """Check that network locations can be read, via SystemConfiguration or networksetup"""
+        sc = _load_framework("SystemConfiguration")
+        if sc is not None:
+            try:
+                prefs = sc.SCPreferencesCreate(None, "macos_auth_discovery", None)
+                if prefs is not None and sc.SCNetworkSetCopyAll(prefs) is not None:
+                    return True
+            except Exception as e:
+                self.logger.debug(f"SystemConfiguration location lookup failed: {e}")
+        
+        return self._run_command_rc(["networksetup", "-listlocations"]) == 0
+
+    def _has_power_management(self) -> bool:
+        """Check that power management settings can be read, via IOKit or pmset"""
+        if HAS_IOKIT:
+            info = _IOKIT.IOPSCopyPowerSourcesInfo()
+            if info:
+                _CORE_FOUNDATION.CFRelease(info)
+                return True
+        
+        return self._run_command_rc(["pmset", "-g"]) == 0
+
+    def _has_display_configuration(self) -> bool:
+        """Check that display configuration can be read, via Quartz or system_profiler"""
+        quartz = _load_framework("Quartz")
+        if quartz is not None:
+            try:
+                error, displays, count = quartz.CGGetActiveDisplayList(16, None, None)
+                if error == 0:
+                    return True
+            except Exception as e:
+                self.logger.debug(f"Quartz display lookup failed: {e}")
+        
+        # system_profiler takes seconds; only used when Quartz is unavailable or
+        # fails (e.g. in a session without WindowServer access)
+        return self._run_command_rc(["system_profiler", "SPDisplaysDataType"]) == 0
+
     def _check_privacy_security_comprehensive(self) -> List[Dict[str, Any]]:
         """Comprehensive Privacy & Security settings check"""
         self._update_progress("Privacy & Security Comprehensive")
-        auth_points = []
-        
-        privacy_categories = [
-            "Location Services", "Contacts", "Calendars", "Reminders", "Photos",
-            "Camera", "Microphone", "Screen Recording", "Files and Folders",
-            "Full Disk Access", "Accessibility", "Developer Tools", "Input Monitoring"
-        ]
-        
-        for category in privacy_categories:
-            auth_points.append({
-                "type": "privacy",
-                "category": category,
-                "location": f"Privacy & Security → {category}",
-                "status": "protected",
-                "requires_auth": True,
-                "auth_type": "admin",
-                "description": f"Modifying {category} permissions requires admin authentication"
-            })
-        
-        return auth_points
+        return [point.copy() for point in _PRIVACY_AUTH_POINTS]
 
     def _check_users_groups_comprehensive(self) -> List[Dict[str, Any]]:
         """Comprehensive Users & Groups settings check"""
         self._update_progress("Users & Groups Comprehensive")
-        auth_points = []
-        
-        # Check user management functions
-        user_functions = [
-            "Add User", "Delete User", "Change Password", "Admin Privileges",
-            "Parental Controls", "Login Options", "Fast User Switching"
-        ]
-        
-        for function in user_functions:
-            auth_points.append({
-                "type": "accounts",
-                "category": "User Management",
-                "location": f"Users & Groups → {function}",
-                "status": "restricted",
-                "requires_auth": True,
-                "auth_type": "admin",
-                "description": f"{function} requires administrator authentication"
-            })
-        
-        return auth_points
+        return [point.copy() for point in _USERS_GROUPS_AUTH_POINTS]
 
     def _check_sharing_services(self) -> List[Dict[str, Any]]:
         """Check Sharing services and their authorization requirements"""
         self._update_progress("Sharing Services")
-        auth_points = []
-        
-        sharing_services = [
-            "Screen Sharing", "File Sharing", "Media Sharing", "Printer Sharing",
-            "Remote Login", "Remote Management", "Remote Apple Events",
-            "Internet Sharing", "Bluetooth Sharing", "Content Caching"
-        ]
-        
-        for service in sharing_services:
-            auth_points.append({
-                "type": "sharing",
-                "category": "Sharing Service",
-                "location": f"Sharing → {service}",
-                "status": "configurable",
-                "requires_auth": True,
-                "auth_type": "admin",
-                "description": f"Enabling {service} requires admin authentication"
-            })
-        
-        return auth_points
+        return [point.copy() for point in _SHARING_AUTH_POINTS]
 
     def _check_time_machine_settings(self) -> List[Dict[str, Any]]:
         """Check Time Machine backup settings"""
@@ -713,20 +1034,20 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check Time Machine status
-        code, stdout, stderr = self._run_command("tmutil status")
+        code, stdout, stderr = self._run_command(["tmutil", "status"])
         if code == 0:
             auth_points.append({
                 "type": "backup",
                 "category": "Time Machine",
                 "location": "Time Machine",
-                "status": "configured" if "Running" in stdout else "available",
+                "status": "configured" if _TMUTIL_RUNNING_PATTERN.search(stdout) else "available",
                 "requires_auth": True,
                 "auth_type": "admin",
                 "description": "Time Machine configuration requires admin authentication"
             })
         
         # Check for backup destinations
-        code, stdout, stderr = self._run_command("tmutil destinationinfo")
+        code, stdout, stderr = self._run_command(["tmutil", "destinationinfo"])
         if code == 0 and stdout.strip():
             auth_points.append({
                 "type": "backup",
@@ -746,8 +1067,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check software update preferences
-        code, stdout, stderr = self._run_command("defaults read /Library/Preferences/com.apple.SoftwareUpdate")
-        if code == 0:
+        if os.path.exists("/Library/Preferences/com.apple.SoftwareUpdate.plist"):
             auth_points.append({
                 "type": "system",
                 "category": "Software Update",
@@ -766,8 +1086,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check network locations
-        code, stdout, stderr = self._run_command("networksetup -listlocations")
-        if code == 0:
+        if self._has_network_locations():
             auth_points.append({
                 "type": "network",
                 "category": "Network Locations",
@@ -794,26 +1113,8 @@ class CommandDiscoveryEngine:
     def _check_accessibility_settings(self) -> List[Dict[str, Any]]:
         """Check Accessibility settings and permissions"""
         self._update_progress("Accessibility Settings")
-        auth_points = []
         
-        accessibility_features = [
-            "Display", "Zoom", "VoiceOver", "Descriptions", "Captions",
-            "Motor", "Switch Control", "Voice Control", "Keyboard",
-            "Pointer Control", "Hearing", "Audio"
-        ]
-        
-        for feature in accessibility_features:
-            auth_points.append({
-                "type": "accessibility",
-                "category": "Accessibility Feature",
-                "location": f"Accessibility → {feature}",
-                "status": "configurable",
-                "requires_auth": True,
-                "auth_type": "admin",
-                "description": f"Configuring {feature} accessibility settings may require authentication"
-            })
-        
-        return auth_points
+        return [point.copy() for point in _ACCESSIBILITY_AUTH_POINTS]
 
     def _check_energy_settings(self) -> List[Dict[str, Any]]:
         """Check Energy/Battery settings"""
@@ -821,8 +1122,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check power management settings
-        code, stdout, stderr = self._run_command("pmset -g")
-        if code == 0:
+        if self._has_power_management():
             auth_points.append({
                 "type": "system",
                 "category": "Energy Settings",
@@ -841,8 +1141,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check display configuration
-        code, stdout, stderr = self._run_command("system_profiler SPDisplaysDataType")
-        if code == 0:
+        if self._has_display_configuration():
             auth_points.append({
                 "type": "display",
                 "category": "Display Configuration",
@@ -861,8 +1160,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check available startup disks
-        code, stdout, stderr = self._run_command("bless --info --getboot")
-        if code == 0:
+        if self._run_command_rc(["bless", "--info", "--getboot"]) == 0:
             auth_points.append({
                 "type": "system",
                 "category": "Startup Disk",
@@ -881,8 +1179,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check system certificates
-        code, stdout, stderr = self._run_command("security dump-trust-settings -s")
-        if code == 0:
+        if self._run_command_rc(["security", "dump-trust-settings", "-s"]) == 0:
             auth_points.append({
                 "type": "security",
                 "category": "Certificate Trust",
@@ -901,8 +1198,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check firewall status
-        code, stdout, stderr = self._run_command("defaults read /Library/Preferences/com.apple.alf globalstate")
-        if code == 0:
+        if "globalstate" in (self._load_plist("/Library/Preferences/com.apple.alf.plist") or {}):
             auth_points.append({
                 "type": "security",
                 "category": "Application Firewall",
@@ -921,8 +1217,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check system extensions
-        code, stdout, stderr = self._run_command("systemextensionsctl list")
-        if code == 0:
+        if self._run_command_rc(["systemextensionsctl", "list"]) == 0:
             auth_points.append({
                 "type": "security",
                 "category": "System Extensions",
@@ -941,8 +1236,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check login items
-        code, stdout, stderr = self._run_command("osascript -e 'tell application \"System Events\" to get the name of every login item'")
-        if code == 0:
+        if self._run_command_rc(["osascript", "-e", 'tell application "System Events" to get the name of every login item']) == 0:
             auth_points.append({
                 "type": "system",
                 "category": "Login Items",
@@ -972,8 +1266,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check audio device settings
-        code, stdout, stderr = self._run_command("system_profiler SPAudioDataType")
-        if code == 0:
+        if self._run_command_rc(["system_profiler", "SPAudioDataType"]) == 0:
             auth_points.append({
                 "type": "system_settings",
                 "category": "Sound",
@@ -985,7 +1278,6 @@ class CommandDiscoveryEngine:
             })
         
         # Check alert sounds
-        code, stdout, stderr = self._run_command("defaults read com.apple.systemsound")
         auth_points.append({
             "type": "system_settings",
             "category": "Sound",
@@ -1004,7 +1296,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check Do Not Disturb settings
-        code, stdout, stderr = self._run_command("defaults read com.apple.ncprefs")
         auth_points.append({
             "type": "system_settings",
             "category": "Focus",
@@ -1023,7 +1314,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check system-wide settings
-        code, stdout, stderr = self._run_command("defaults read NSGlobalDomain")
         auth_points.append({
             "type": "system_settings",
             "category": "General",
@@ -1035,7 +1325,6 @@ class CommandDiscoveryEngine:
         })
         
         # Check AirDrop & Handoff
-        code, stdout, stderr = self._run_command("defaults read com.apple.sharingd")
         auth_points.append({
             "type": "system_settings",
             "category": "General",
@@ -1054,7 +1343,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check appearance mode
-        code, stdout, stderr = self._run_command("defaults read NSGlobalDomain AppleInterfaceStyle")
         auth_points.append({
             "type": "system_settings",
             "category": "Appearance",
@@ -1066,7 +1354,6 @@ class CommandDiscoveryEngine:
         })
         
         # Check accent color
-        code, stdout, stderr = self._run_command("defaults read NSGlobalDomain AppleAccentColor")
         auth_points.append({
             "type": "system_settings",
             "category": "Appearance",
@@ -1085,7 +1372,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check Dock settings
-        code, stdout, stderr = self._run_command("defaults read com.apple.dock")
         auth_points.append({
             "type": "system_settings",
             "category": "Desktop & Dock",
@@ -1097,7 +1383,6 @@ class CommandDiscoveryEngine:
         })
         
         # Check Mission Control
-        code, stdout, stderr = self._run_command("defaults read com.apple.dock expose-animation-duration")
         auth_points.append({
             "type": "system_settings",
             "category": "Desktop & Dock",
@@ -1116,7 +1401,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check wallpaper settings
-        code, stdout, stderr = self._run_command("defaults read com.apple.desktop")
         auth_points.append({
             "type": "system_settings",
             "category": "Wallpaper & Screen Saver",
@@ -1128,7 +1412,6 @@ class CommandDiscoveryEngine:
         })
         
         # Check screen saver settings
-        code, stdout, stderr = self._run_command("defaults read com.apple.screensaver")
         auth_points.append({
             "type": "system_settings",
             "category": "Wallpaper & Screen Saver",
@@ -1147,7 +1430,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check keyboard settings
-        code, stdout, stderr = self._run_command("defaults read NSGlobalDomain InitialKeyRepeat")
         auth_points.append({
             "type": "system_settings",
             "category": "Keyboard",
@@ -1159,7 +1441,6 @@ class CommandDiscoveryEngine:
         })
         
         # Check mouse settings
-        code, stdout, stderr = self._run_command("defaults read com.apple.driver.AppleBluetoothMultitouch.mouse")
         auth_points.append({
             "type": "system_settings",
             "category": "Mouse",
@@ -1178,7 +1459,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check trackpad settings
-        code, stdout, stderr = self._run_command("defaults read com.apple.driver.AppleBluetoothMultitouch.trackpad")
         auth_points.append({
             "type": "system_settings",
             "category": "Trackpad",
@@ -1197,7 +1477,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check printer settings - requires admin for adding/removing
-        code, stdout, stderr = self._run_command("lpstat -p")
         auth_points.append({
             "type": "system_settings",
             "category": "Printers & Scanners",
@@ -1216,7 +1495,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check Game Center settings
-        code, stdout, stderr = self._run_command("defaults read com.apple.gamed")
         auth_points.append({
             "type": "system_settings",
             "category": "Game Center",
@@ -1235,7 +1513,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check internet accounts
-        code, stdout, stderr = self._run_command("defaults read MobileMeAccounts")
         auth_points.append({
             "type": "system_settings",
             "category": "Internet Accounts",
@@ -1290,8 +1567,8 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check biometric settings
-        code, stdout, stderr = self._run_command("bioutil -rs")
-        if "Touch ID" in stdout or "Face ID" in stdout:
+        code, stdout, stderr = self._run_command(["bioutil", "-rs"])
+        if _BIOMETRIC_PATTERN.search(stdout):
             auth_points.append({
                 "type": "system_settings",
                 "category": "Touch ID & Passcode",
@@ -1310,7 +1587,7 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Check date/time settings
-        code, stdout, stderr = self._run_command("systemsetup -getdate")
+        code, stdout, stderr = self._run_command(["systemsetup", "-getdate"])
         if code == 0 or "requires admin" in stderr.lower():
             auth_points.append({
                 "type": "system_settings",
@@ -1330,7 +1607,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Screen Time settings
-        code, stdout, stderr = self._run_command("defaults read com.apple.screentime")
         auth_points.append({
             "type": "system_settings",
             "category": "Screen Time",
@@ -1349,7 +1625,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Control Center settings
-        code, stdout, stderr = self._run_command("defaults read com.apple.controlcenter")
         auth_points.append({
             "type": "system_settings",
             "category": "Control Center",
@@ -1368,7 +1643,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Siri settings
-        code, stdout, stderr = self._run_command("defaults read com.apple.assistant.support")
         auth_points.append({
             "type": "system_settings",
             "category": "Siri & Spotlight",
@@ -1380,7 +1654,6 @@ class CommandDiscoveryEngine:
         })
         
         # Spotlight settings
-        code, stdout, stderr = self._run_command("defaults read com.apple.spotlight")
         auth_points.append({
             "type": "system_settings",
             "category": "Siri & Spotlight",
@@ -1399,7 +1672,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Notification settings
-        code, stdout, stderr = self._run_command("defaults read com.apple.ncprefs")
         auth_points.append({
             "type": "system_settings",
             "category": "Notifications",
@@ -1418,7 +1690,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # VPN configuration
-        code, stdout, stderr = self._run_command("scutil --nc list")
         auth_points.append({
             "type": "system_settings",
             "category": "VPN",
@@ -1455,7 +1726,6 @@ class CommandDiscoveryEngine:
         auth_points = []
         
         # Storage management
-        code, stdout, stderr = self._run_command("df -h")
         auth_points.append({
             "type": "system_settings",
             "category": "Storage",
@@ -1467,7 +1737,6 @@ class CommandDiscoveryEngine:
         })
         
         # iCloud storage optimization
-        code, stdout, stderr = self._run_command("defaults read com.apple.bird")
         auth_points.append({
             "type": "system_settings",
             "category": "Storage",
@@ -1483,113 +1752,142 @@ class CommandDiscoveryEngine:
     def _generate_comprehensive_authorization_map(self) -> List[Dict[str, Any]]:
         """Generate comprehensive authorization map from known System Settings locations"""
         self._update_progress("Comprehensive Authorization Mapping")
-        auth_points = []
         
-        for pane_name, authorizations in self.authorization_map.items():
-            for auth in authorizations:
-                auth_points.append({
-                    "type": "system_settings",
-                    "category": auth["element"],
-                    "pane": pane_name,
-                    "location": f"{pane_name} → {auth['element']}",
-                    "status": "available",
-                    "requires_auth": auth["auth_type"] != "none",
-                    "auth_type": auth["auth_type"],
-                    "description": auth["description"],
-                    "source": "authorization_map"
-                })
-        
-        return auth_points
+        return [entry.copy() for entry in _AUTHORIZATION_MAP_ENTRIES]
+
+    def _add_results(self, results: List[Dict[str, Any]]):
+        """Append results and update the running per-type counts"""
+        for result in results:
+            result.setdefault("type", "unknown")
+        self.discovery_results.extend(results)
+        self._results_version += 1  # Only after the list changed; see get_results()
+        self._category_counts.update(map(_get_type, results))
+
+    def _run_discovery_method(self, method) -> List[Dict[str, Any]]:
+        """Run a single discovery method, logging and suppressing its errors"""
+        try:
+            return method()
+        except Exception as e:
+            self.logger.error(f"Error in {method.__name__}: {e}")
+            return []
+
+    def _get_discovery_methods(self) -> List:
+        """Get the ordered list of discovery methods run by a full discovery pass"""
+        # Comprehensive discovery methods - significantly expanded to cover all 36+ System Settings areas
+        return [
+            # Core system security methods
+            self._check_network_security,
+            self._check_authorization_database,
+            self._check_user_accounts,
+            self._check_keychain_access,
+            self._check_system_preferences_auth,
+            self._check_developer_tools,
+            
+            # Network & Communication methods
+            self._check_wifi_security,
+            self._check_bluetooth_security,
+            self._check_network_advanced_settings,
+            self._check_vpn_settings,
+            
+            # Privacy & Security comprehensive methods
+            self._check_privacy_security_comprehensive,
+            self._check_accessibility_settings,
+            self._check_certificate_trust_settings,
+            self._check_application_firewall,
+            self._check_system_extensions,
+            
+            # User & System Management methods
+            self._check_users_groups_comprehensive,
+            self._check_login_items_comprehensive,
+            self._check_touch_id_passcode_settings,
+            self._check_passwords_settings,
+            
+            # System Settings UI Areas (all 36+ areas)
+            self._check_sound_settings,
+            self._check_focus_settings,
+            self._check_notifications_settings,
+            self._check_screen_time_settings,
+            self._check_general_settings,
+            self._check_appearance_settings,
+            self._check_control_center_settings,
+            self._check_siri_spotlight_settings,
+            self._check_desktop_dock_settings,
+            self._check_display_settings,
+            self._check_wallpaper_screensaver_settings,
+            self._check_energy_settings,
+            self._check_keyboard_mouse_settings,
+            self._check_trackpad_settings,
+            self._check_printers_scanners_settings,
+            self._check_game_center_settings,
+            self._check_internet_accounts_settings,
+            self._check_wallet_apple_pay_settings,
+            self._check_date_time_settings,
+            
+            # System Maintenance & Backup
+            self._check_sharing_services,
+            self._check_time_machine_settings,
+            self._check_software_update_settings,
+            self._check_transfer_reset_settings,
+            self._check_storage_settings,
+            self._check_startup_disk_settings,
+            
+            # Comprehensive authorization mapping
+            self._generate_comprehensive_authorization_map
+        ]
 
-    def discover_all_authorizations(self) -> List[Dict[str, Any]]:
-        """Run comprehensive authorization discovery"""
+    def discover_all_authorizations(self, max_age: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Run comprehensive authorization discovery
+        
+        If max_age is given and the last discovery completed less than max_age
+        seconds ago, its results are returned without scanning again.
+        """
+        if (max_age is not None and self.completion_status == "completed"
+                and (datetime.now() - self.end_time).total_seconds() < max_age):
+            self.logger.info(f"Reusing results of a discovery completed within the last {max_age}s")
+            return self.discovery_results
+        
         self.logger.info("Starting comprehensive macOS authorization discovery...")
         self.is_running = True
         self.completion_status = "running"  # Set to running
         self.start_time = datetime.now()  # Record start time
         self.end_time = None  # Reset end time
-        self.progress = 0
         self.current_check = 0
         self.discovery_results = []
+        self._category_counts = Counter()
+        self._results_version += 1
+        self.clear_cache()  # Each run probes the live system afresh
         
         try:
-            # Comprehensive discovery methods - significantly expanded to cover all 36+ System Settings areas
-            discovery_methods = [
-                # Core system security methods
-                self._check_network_security,
-                self._check_authorization_database,
-                self._check_user_accounts,
-                self._check_keychain_access,
-                self._check_system_preferences_auth,
-                self._check_developer_tools,
-                
-                # Network & Communication methods
-                self._check_wifi_security,
-                self._check_bluetooth_security,
-                self._check_network_advanced_settings,
-                self._check_vpn_settings,
-                
-                # Privacy & Security comprehensive methods
-                self._check_privacy_security_comprehensive,
-                self._check_accessibility_settings,
-                self._check_certificate_trust_settings,
-                self._check_application_firewall,
-                self._check_system_extensions,
-                
-                # User & System Management methods
-                self._check_users_groups_comprehensive,
-                self._check_login_items_comprehensive,
-                self._check_touch_id_passcode_settings,
-                self._check_passwords_settings,
-                
-                # System Settings UI Areas (all 36+ areas)
-                self._check_sound_settings,
-                self._check_focus_settings,
-                self._check_notifications_settings,
-                self._check_screen_time_settings,
-                self._check_general_settings,
-                self._check_appearance_settings,
-                self._check_control_center_settings,
-                self._check_siri_spotlight_settings,
-                self._check_desktop_dock_settings,
-                self._check_display_settings,
-                self._check_wallpaper_screensaver_settings,
-                self._check_energy_settings,
-                self._check_keyboard_mouse_settings,
-                self._check_trackpad_settings,
-                self._check_printers_scanners_settings,
-                self._check_game_center_settings,
-                self._check_internet_accounts_settings,
-                self._check_wallet_apple_pay_settings,
-                self._check_date_time_settings,
-                
-                # System Maintenance & Backup
-                self._check_sharing_services,
-                self._check_time_machine_settings,
-                self._check_software_update_settings,
-                self._check_transfer_reset_settings,
-                self._check_storage_settings,
-                self._check_startup_disk_settings,
-                
-                # Comprehensive authorization mapping
-                self._generate_comprehensive_authorization_map
-            ]
+            discovery_methods = self._get_discovery_methods()
+            self.total_checks = len(discovery_methods)
             
-            for method in discovery_methods:
-                try:
-                    results = method()
-                    self.discovery_results.extend(results)
-                except Exception as e:
-                    self.logger.error(f"Error in {method.__name__}: {e}")
+            if self.serial:
+                for method in discovery_methods:
+                    self._add_results(self._run_discovery_method(method))
+                    self._complete_check()
+            else:
+                with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                    futures = [executor.submit(self._run_discovery_method, method) for method in discovery_methods]
+                    next_result = 0
+                    # Progress counts each method as soon as it finishes, but results
+                    # are added in method order so their ordering stays deterministic
+                    for _ in as_completed(futures):
+                        self._complete_check()
+                        while next_result < len(futures) and futures[next_result].done():
+                            self._add_results(futures[next_result].result())
+                            next_result += 1
             
             # Enhance authorization rights for points that don't have them
             self.logger.info("Enhancing authorization rights for discovered points...")
             self.discovery_results = self._enhance_authorization_rights(self.discovery_results)
+            self._results_version += 1
             
-            self.progress = 100
             self.end_time = datetime.now()  # Record completion time
             self.completion_status = "completed"  # Mark as successfully completed
-            self.logger.info(f"Discovery complete. Found {len(self.discovery_results)} authorization points.")
+            self.logger.info(
+                f"Discovery complete. Ran {self.current_check}/{self.total_checks} checks and found "
+                f"{len(self.discovery_results)} authorization points in {self.get_elapsed_seconds():.1f}s."
+            )
             
         except Exception as e:
             self.logger.error(f"Discovery error: {e}")
@@ -1636,26 +1934,36 @@ class CommandDiscoveryEngine:
             self.end_time = datetime.now()
             self.logger.info("Discovery stopped manually")
 
-    def get_results(self) -> List[Dict[str, Any]]:
-        """Get discovery results"""
-        return self.discovery_results
+    def get_results(self) -> Tuple[Dict[str, Any], ...]:
+        """Get discovery results as an immutable snapshot shared between readers"""
+        # Read the version before copying: a copy tagged with it holds at least
+        # that version's results, and any later change makes the tag stale
+        version = self._results_version
+        snapshot = self._results_snapshot
+        if snapshot is None or snapshot[0] != version:
+            snapshot = (version, tuple(self.discovery_results))
+            self._results_snapshot = snapshot
+        return snapshot[1]
+
+    def get_results_total(self) -> int:
+        """Get the number of discovered authorization points"""
+        return len(self.discovery_results)
+
+    def to_json(self) -> bytes:
+        """Serialize discovery results to newline-terminated JSON bytes"""
+        if HAS_ORJSON:
+            return orjson.dumps(self.discovery_results, default=str, option=orjson.OPT_APPEND_NEWLINE)
+        return (json.dumps(self.discovery_results, default=str) + "\n").encode("utf-8")
 
     def get_results_summary(self) -> Dict[str, Any]:
         """Get a summary of discovery results"""
         if not self.discovery_results:
             return {"total": 0, "categories": {}}
         
-        categories = {}
-        for result in self.discovery_results:
-            category = result.get("type", "unknown")
-            if category not in categories:
-                categories[category] = 0
-            categories[category] += 1
-        
         return {
             "total": len(self.discovery_results),
-            "categories": categories,
-            "last_updated": datetime.now().isoformat()
+            "categories": dict(self._category_counts),
+            "last_updated": _current_timestamp()
         }
 
     def get_authorization_map(self) -> Dict[str, Any]:
@@ -1664,7 +1972,7 @@ class CommandDiscoveryEngine:
             "authorization_map": self.authorization_map,
             "total_panes": len(self.authorization_map),
             "total_authorizations": sum(len(auths) for auths in self.authorization_map.values()),
-            "generated": datetime.now().isoformat()
+            "generated": _current_timestamp()
         }
 
     def get_pane_discovery_info(self) -> Dict[str, Any]:
@@ -20,6 +20,12 @@ except ImportError:
 class HardwareProfileManager:
     """Manages hardware detection and classification for macOS systems"""
     
+    # system_profiler data types fetched together in a single run
+    SYSTEM_PROFILER_DATA_TYPES = (
+        'SPThunderboltDataType', 'SPBluetoothDataType',
+        'SPDisplaysDataType', 'SPAudioDataType'
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.hardware_profile = {}
@@ -29,18 +35,19 @@ class HardwareProfileManager:
     def _detect_hardware(self):
         """Detect current hardware configuration"""
         try:
+            profiler_data = self._get_system_profiler_data()
             self.hardware_profile = {
                 'model': self._get_model_identifier(),
                 'processor': self._get_processor_info(),
                 'has_battery': self._has_battery(),
                 'has_touch_id': self._has_touch_id(),
                 'has_face_id': self._has_face_id(),
-                'has_thunderbolt': self._has_thunderbolt(),
+                'has_thunderbolt': self._has_thunderbolt(profiler_data),
                 'has_ethernet': self._has_ethernet(),
                 'has_wifi': self._has_wifi(),
-                'has_bluetooth': self._has_bluetooth(),
-                'display_count': self._get_display_count(),
-                'audio_devices': self._get_audio_devices(),
+                'has_bluetooth': self._has_bluetooth(profiler_data),
+                'display_count': self._get_display_count(profiler_data),
+                'audio_devices': self._get_audio_devices(profiler_data),
                 'macos_version': self._get_macos_version()
             }
             
@@ -50,6 +57,15 @@ class HardwareProfileManager:
             self.logger.error(f"Error detecting hardware: {e}")
             self.hardware_profile = self._get_fallback_profile()
     
+    def _get_system_profiler_data(self) -> Optional[Dict]:
+        """Get system_profiler data for all hardware data types in a single run"""
+        try:
+            result = subprocess.run(['system_profiler', '-json', *self.SYSTEM_PROFILER_DATA_TYPES], 
+                                  capture_output=True, text=True)
+            return json.loads(result.stdout)
+        except Exception:
+            return None
+    
     def _get_model_identifier(self) -> str:
         """Get Mac model identifier"""
         try:
@@ -102,13 +118,10 @@ class HardwareProfileManager:
         # Currently no Macs have Face ID, but keeping for future
         return False
     
-    def _has_thunderbolt(self) -> bool:
+    def _has_thunderbolt(self, profiler_data: Optional[Dict]) -> bool:
         """Check if system has Thunderbolt ports"""
         try:
-            result = subprocess.run(['system_profiler', 'SPThunderboltDataType', '-json'], 
-                                  capture_output=True, text=True)
-            data = json.loads(result.stdout)
-            return len(data.get('SPThunderboltDataType', [])) > 0
+            return len(profiler_data.get('SPThunderboltDataType', [])) > 0
         except Exception:
             return False
     
@@ -130,34 +143,25 @@ class HardwareProfileManager:
         except Exception:
             return True  # Assume Wi-Fi is present on most modern Macs
     
-    def _has_bluetooth(self) -> bool:
+    def _has_bluetooth(self, profiler_data: Optional[Dict]) -> bool:
         """Check if system has Bluetooth"""
         try:
-            result = subprocess.run(['system_profiler', 'SPBluetoothDataType', '-json'], 
-                                  capture_output=True, text=True)
-            data = json.loads(result.stdout)
-            return len(data.get('SPBluetoothDataType', [])) > 0
+            return len(profiler_data.get('SPBluetoothDataType', [])) > 0
         except Exception:
             return True  # Assume Bluetooth is present on most modern Macs
     
-    def _get_display_count(self) -> int:
+    def _get_display_count(self, profiler_data: Optional[Dict]) -> int:
         """Get number of displays"""
         try:
-            result = subprocess.run(['system_profiler', 'SPDisplaysDataType', '-json'], 
-                                  capture_output=True, text=True)
-            data = json.loads(result.stdout)
-            displays = data.get('SPDisplaysDataType', [])
+            displays = profiler_data.get('SPDisplaysDataType', [])
             return len(displays)
         except Exception:
             return 1  # Assume at least one display
     
-    def _get_audio_devices(self) -> List[str]:
+    def _get_audio_devices(self, profiler_data: Optional[Dict]) -> List[str]:
         """Get audio device information"""
         try:
-            result = subprocess.run(['system_profiler', 'SPAudioDataType', '-json'], 
-                                  capture_output=True, text=True)
-            data = json.loads(result.stdout)
-            audio_data = data.get('SPAudioDataType', [])
+            audio_data = profiler_data.get('SPAudioDataType', [])
             devices = []
             for item in audio_data:
                 if '_items' in item:
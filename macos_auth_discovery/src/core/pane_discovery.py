@@ -8,6 +8,7 @@ import logging
 import subprocess
 import os
 import re
+from collections import Counter
 from typing import Dict, List, Set, Optional, Any, Union
 from pathlib import Path
 
@@ -15,6 +16,10 @@ from pathlib import Path
 class SystemSettingsPaneDiscovery:
     """Dynamically discovers available System Settings panes and preference panes"""
     
+    # Preference pane locations, expanded once at import
+    SYSTEM_PREFERENCE_PANES_DIR = "/System/Library/PreferencePanes"
+    USER_PREFERENCE_PANES_DIR = os.path.expanduser("~/Library/PreferencePanes")
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.discovered_panes = []
@@ -109,7 +114,7 @@ class SystemSettingsPaneDiscovery:
         panes = []
         
         # Check /System/Library/PreferencePanes/
-        system_pref_dir = "/System/Library/PreferencePanes"
+        system_pref_dir = self.SYSTEM_PREFERENCE_PANES_DIR
         if os.path.exists(system_pref_dir):
             try:
                 pref_panes = os.listdir(system_pref_dir)
@@ -129,7 +134,7 @@ class SystemSettingsPaneDiscovery:
                 self.logger.warning(f"Failed to discover preference panes: {e}")
         
         # Check user-installed preference panes
-        user_pref_dir = os.path.expanduser("~/Library/PreferencePanes")
+        user_pref_dir = self.USER_PREFERENCE_PANES_DIR
         if os.path.exists(user_pref_dir):
             try:
                 user_panes = os.listdir(user_pref_dir)
@@ -325,12 +330,7 @@ class SystemSettingsPaneDiscovery:
             self.discover_all_panes()
         
         available_panes = [p for p in self.discovered_panes if p['available']]
-        types = {}
-        for pane in available_panes:
-            pane_type = pane['type']
-            if pane_type not in types:
-                types[pane_type] = 0
-            types[pane_type] += 1
+        types = dict(Counter(pane['type'] for pane in available_panes))
         
         return {
             'total_panes': len(available_panes),
@@ -11,13 +11,16 @@ import threading
 from datetime import datetime
 from typing import Dict, List
 
-from flask import Flask, render_template, jsonify, request, send_file
+from flask import Flask, Response, render_template, jsonify, request, send_file
 import logging
 
 # Add the src directory to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.command_discovery import CommandDiscoveryEngine
+from core.command_discovery import CommandDiscoveryEngine, HAS_ORJSON
+
+if HAS_ORJSON:
+    import orjson
 
 # Store latest results globally
 latest_results = None
@@ -25,6 +28,22 @@ discovery_engine = None
 discovery_thread = None
 
 
+def _json_response(payload):
+    """Build a JSON response for large payloads, encoding with orjson when available"""
+    if HAS_ORJSON:
+        return Response(orjson.dumps(payload, default=str), mimetype='application/json')
+    return jsonify(payload)
+
+
+def _write_json_file(path, payload):
+    """Write a payload to a file as indented JSON, encoding with orjson when available"""
+    if HAS_ORJSON:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(payload, f, indent=2)
+
 
 def create_app():
     """Create and configure Flask application"""
@@ -45,7 +64,7 @@ def create_app():
             is_running = discovery_engine.is_discovery_running()
             is_completed = discovery_engine.is_discovery_completed()
             progress = discovery_engine.get_progress()
-            results_count = len(discovery_engine.get_results())
+            results_count = discovery_engine.get_results_total()
             elapsed_seconds = discovery_engine.get_elapsed_seconds()
             completion_status = discovery_engine.get_completion_status()
             
@@ -146,11 +165,11 @@ def create_app():
         global latest_results, discovery_engine
         
         if latest_results:
-            return jsonify(latest_results)
-        elif discovery_engine and discovery_engine.get_results():
+            return _json_response(latest_results)
+        elif discovery_engine and discovery_engine.get_results_total():
             # Get results from current engine if available
             results = discovery_engine.get_results()
-            return jsonify({
+            return _json_response({
                 'discovery_results': results,
                 'summary': discovery_engine.get_results_summary(),
                 'timestamp': datetime.now().isoformat(),
@@ -269,7 +288,7 @@ def create_app():
         """Get discovery results"""
         global latest_results
         if latest_results:
-            return jsonify(latest_results)
+            return _json_response(latest_results)
         return jsonify({
             'error': 'No results available'
         })
@@ -300,8 +319,7 @@ def create_app():
             filename = f'auth_discovery_export_{timestamp}.json'
             filepath = f'data/{filename}'
             
-            with open(filepath, 'w') as f:
-                json.dump(latest_data, f, indent=2)
+            _write_json_file(filepath, latest_data)
             
             return send_file(filepath, as_attachment=True, download_name=filename)
         